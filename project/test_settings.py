@@ -0,0 +1,41 @@
+"""
+Test settings for the project.
+
+Run the suite with DJANGO_SETTINGS_MODULE=project.test_settings to use an
+in-memory SQLite database, a fast password hasher, and no log-file writes.
+"""
+
+from .settings import *  # noqa: F401,F403
+
+# Keep the whole test database in memory instead of on disk
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+    }
+}
+
+# Plain static file storage: no manifest hashing or compression work when
+# a rendered template hits {% static %}
+STATICFILES_STORAGE = 'django.contrib.staticfiles.storage.StaticFilesStorage'
+
+# MD5 is insecure but orders of magnitude faster than PBKDF2, which is all
+# that matters for throwaway test credentials
+PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
+# Silence all logging during tests; the tournament.state file handler in
+# particular writes to disk on every state change
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': True,
+    'handlers': {
+        'null': {'class': 'logging.NullHandler'},
+    },
+    'root': {'handlers': ['null']},
+    'loggers': {
+        'tournament.state': {
+            'handlers': ['null'],
+            'propagate': False,
+        },
+    },
+}
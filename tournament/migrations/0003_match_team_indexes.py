@@ -0,0 +1,21 @@
+# Generated by Django 3.2.25 on 2026-08-28 17:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tournament', '0002_remove_match_away_score_remove_match_home_score'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='match',
+            index=models.Index(fields=['tournament', 'status'], name='tournament__tournam_51dd9a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='team',
+            index=models.Index(fields=['tournament', 'registration_complete'], name='tournament__tournam_343b23_idx'),
+        ),
+    ]
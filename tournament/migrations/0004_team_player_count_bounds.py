@@ -0,0 +1,17 @@
+# Generated by Django 3.2.25 on 2026-08-28 17:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tournament', '0003_match_team_indexes'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='team',
+            constraint=models.CheckConstraint(check=models.Q(('player_count__gte', 0), ('player_count__lte', 14)), name='team_player_count_bounds'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 3.2.25 on 2026-08-28 17:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tournament', '0004_team_player_count_bounds'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='match',
+            name='tournament__tournam_51dd9a_idx',
+        ),
+        migrations.AddIndex(
+            model_name='match',
+            index=models.Index(fields=['tournament', 'status', 'stage'], name='tournament__tournam_173832_idx'),
+        ),
+    ]
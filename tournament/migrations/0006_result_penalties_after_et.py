@@ -0,0 +1,17 @@
+# Generated by Django 3.2.25 on 2026-08-28 17:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tournament', '0005_match_status_stage_index'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='result',
+            constraint=models.CheckConstraint(check=models.Q(('penalties', False), ('extra_time', True), _connector='OR'), name='result_penalties_after_et'),
+        ),
+    ]
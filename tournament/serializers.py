@@ -1,7 +1,25 @@
+import copy
+
 from rest_framework import serializers
 from .models import Tournament, Team, Match, Result
 
-class TournamentSerializer(serializers.ModelSerializer):
+class CachedFieldsMixin:
+    """Build each ModelSerializer's field map once per class.
+
+    DRF re-runs model introspection in get_fields for every serializer
+    instantiation, which repeats per request on list endpoints. The
+    built map is cached on first use and each instance gets deep copies
+    of the fields, so binding stays per-instance.
+    """
+    _fields_cache = {}
+
+    def get_fields(self):
+        fields = self._fields_cache.get(self.__class__)
+        if fields is None:
+            fields = self._fields_cache[self.__class__] = super().get_fields()
+        return {name: copy.deepcopy(field) for name, field in fields.items()}
+
+class TournamentSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     team_count = serializers.SerializerMethodField()
     stage = serializers.SerializerMethodField()
     
@@ -11,22 +29,33 @@ class TournamentSerializer(serializers.ModelSerializer):
                  'status', 'team_count', 'stage']
 
     def get_team_count(self, obj):
-        return obj.team_set.filter(registration_complete=True).count()
-        
+        # Prefer the viewset's annotation; fall back to a COUNT query for
+        # tournaments serialized outside an annotated queryset
+        count = getattr(obj, 'registered_team_count', None)
+        if count is None:
+            count = obj.team_set.filter(registration_complete=True).count()
+        return count
+
     def get_stage(self, obj):
         if obj.status == 'KNOCKOUT':
-            match_count = Match.objects.filter(
-                tournament=obj,
-                status__in=['SCHEDULED', 'PENDING'],
-                stage__in=['QUARTER', 'SEMI', 'FINAL']
-            ).count()
-            if match_count == 2:
+            semi_pending = getattr(obj, 'semi_pending', None)
+            if semi_pending is None:
+                # Unannotated instance: EXISTS probes stop at the first
+                # row, unlike counting every pending knockout match
+                pending = Match.objects.filter(
+                    tournament=obj, status__in=['SCHEDULED', 'PENDING']
+                )
+                semi_pending = pending.filter(stage='SEMI').exists()
+                final_pending = pending.filter(stage='FINAL').exists()
+            else:
+                final_pending = obj.final_pending
+            if semi_pending:
                 return 'Semi Finals'
-            elif match_count == 1:
+            elif final_pending:
                 return 'Final'
         return obj.get_status_display()
 
-class MatchSerializer(serializers.ModelSerializer):
+class MatchSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     home_score = serializers.SerializerMethodField()
     away_score = serializers.SerializerMethodField()
 
@@ -36,12 +65,20 @@ class MatchSerializer(serializers.ModelSerializer):
                  'home_score', 'away_score', 'stage', 'status']
 
     def get_home_score(self, obj):
-        return obj.result.home_score if hasattr(obj, 'result') else 0
+        # With select_related('result') on the viewset this reads the
+        # cached object; hasattr() would issue a query per row instead
+        try:
+            return obj.result.home_score
+        except Result.DoesNotExist:
+            return 0
 
     def get_away_score(self, obj):
-        return obj.result.away_score if hasattr(obj, 'result') else 0
+        try:
+            return obj.result.away_score
+        except Result.DoesNotExist:
+            return 0
 
-class ResultSerializer(serializers.ModelSerializer):
+class ResultSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Result
         fields = [
@@ -76,7 +113,7 @@ class MatchResultSerializer(serializers.Serializer):
             raise serializers.ValidationError("Penalties can only occur after extra time")
         return data
 
-class TeamSerializer(serializers.ModelSerializer):
+class TeamSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Team
         fields = ['id', 'name', 'player_count', 'registration_complete']
\ No newline at end of file
@@ -1,11 +1,25 @@
-from typing import List, Dict, Optional
+from typing import List, Dict
 from django.utils import timezone
 from django.db.models import Q
 from tournament.models import Tournament, Team, Match
 from datetime import timedelta
-import heapq
 import itertools
 
+class _TeamStats:
+    """Per-team standings accumulator.
+
+    Fixed slots make the hot `stats.points += 3` updates C-level
+    attribute fetches instead of dict hashing, and keep each entry far
+    smaller than a dict.
+    """
+    __slots__ = ('points', 'goals_for', 'goals_against')
+
+    def __init__(self):
+        self.points = 0
+        self.goals_for = 0
+        self.goals_against = 0
+
+
 class GroupStageService:
     def __init__(self, tournament: Tournament):
         self.tournament = tournament
@@ -14,130 +28,120 @@ class GroupStageService:
             registration_complete=True
         ).order_by('id'))
         self.groups = None
-        self._pq = []  # Priority queue for standings
-        self._entry_finder = {}  # Track team entries
-        self._counter = itertools.count()  # Unique sequence count
-        self.REMOVED = '<removed>'  # Placeholder for removed teams
-
-    def _add_team_to_standings(self, team: Team, points: int, goal_diff: int, goals_for: int):
-        """Add or update team in standings priority queue"""
-        if team in self._entry_finder:
-            self._remove_team(team)
-        count = next(self._counter)
-        # Priority tuple: (-points, -goal_diff, -goals_for) for max heap behavior
-        priority = (-points, -goal_diff, -goals_for)
-        entry = [priority, count, team]
-        self._entry_finder[team] = entry
-        heapq.heappush(self._pq, entry)
-
-    def _remove_team(self, team: Team):
-        """Remove team from standings"""
-        entry = self._entry_finder.pop(team)
-        entry[-1] = self.REMOVED
-
-    def _get_next_team(self) -> Optional[Team]:
-        """Get next team from standings queue"""
-        while self._pq:
-            priority, count, team = heapq.heappop(self._pq)
-            if team is not self.REMOVED:
-                del self._entry_finder[team]
-                return team, priority
-        return None
+        self._group_matches_cache = None  # Per-instance group match cache
+        self._team_stats_index = None  # {team_id: stats} standings index
+
+    def _load_group_matches(self) -> List[Match]:
+        """Fetch the tournament's group matches once per service instance.
+
+        Standings and the completion check both walk the same rows; one
+        cached query (result and both teams joined) serves them all.
+        Match-creating methods reset the cache.
+        """
+        if self._group_matches_cache is None:
+            # Standings read status, group, scores and the teams; slugs,
+            # dispute text and dates are dead weight per row
+            self._group_matches_cache = list(Match.objects.filter(
+                tournament=self.tournament,
+                stage='GROUP'
+            ).select_related('result', 'team_home', 'team_away')
+             .defer('slug', 'dispute_reason', 'match_date'))
+        return self._group_matches_cache
 
     def get_group_standings(self, group_letter=None) -> List[Dict]:
-        """Get standings using priority queue"""
-        # Clear existing queue
-        self._pq = []
-        self._entry_finder = {}
-        
-        matches = Match.objects.filter(
-            tournament=self.tournament,
-            stage='GROUP',
-            status='CONFIRMED'
-        ).select_related('result')
-        if group_letter:
-            matches = matches.filter(group=group_letter)
-
-        # Calculate team statistics
+        """Get standings sorted by points, goal difference, goals for"""
+        # The aggregation touches both team FKs and the result of every
+        # confirmed match; the cached fetch joins them all
+        matches = [
+            match for match in self._load_group_matches()
+            if match.status == 'CONFIRMED'
+            and (not group_letter or match.group == group_letter)
+        ]
+        return self._standings_from_matches(matches)
+
+    def _standings_from_matches(self, matches) -> List[Dict]:
+        """Aggregate and sort standings for an in-memory match list"""
+        # Calculate team statistics; resolve each team's accumulator
+        # once per row instead of re-hashing it for every field update
         team_stats = {}
         for match in matches:
             result = match.result
             for team, is_home in [(match.team_home, True), (match.team_away, False)]:
-                if team not in team_stats:
-                    team_stats[team] = {'points': 0, 'goals_for': 0, 'goals_against': 0}
-                
+                stats = team_stats.get(team)
+                if stats is None:
+                    stats = team_stats[team] = _TeamStats()
+
                 goals_for = result.home_score if is_home else result.away_score
                 goals_against = result.away_score if is_home else result.home_score
-                
-                team_stats[team]['goals_for'] += goals_for
-                team_stats[team]['goals_against'] += goals_against
-                
+
+                stats.goals_for += goals_for
+                stats.goals_against += goals_against
+
                 if goals_for > goals_against:
-                    team_stats[team]['points'] += 3
+                    stats.points += 3
                 elif goals_for == goals_against:
-                    team_stats[team]['points'] += 1
-
-        # Add teams to priority queue
-        for team, stats in team_stats.items():
-            self._add_team_to_standings(
-                team,
-                stats['points'],
-                stats['goals_for'] - stats['goals_against'],
-                stats['goals_for']
-            )
+                    stats.points += 1
 
-        # Extract sorted standings
-        standings = []
-        while True:
-            result = self._get_next_team()
-            if not result:
-                break
-            team, (neg_points, neg_goal_diff, neg_goals_for) = result
-            standings.append({
+        # A plain sort beats the old lazy-deletion heap here: groups
+        # hold a handful of teams and Timsort runs the comparisons in C
+        return [
+            {
                 'team': team,
-                'points': -neg_points,
-                'goal_difference': -neg_goal_diff,
-                'goals_for': -neg_goals_for,
-                'goals_against': team_stats[team]['goals_against']
-            })
-
-        return standings
+                'points': stats.points,
+                'goal_difference': stats.goals_for - stats.goals_against,
+                'goals_for': stats.goals_for,
+                'goals_against': stats.goals_against,
+            }
+            for team, stats in sorted(
+                team_stats.items(),
+                key=lambda item: (
+                    -item[1].points,
+                    -(item[1].goals_for - item[1].goals_against),
+                    -item[1].goals_for,
+                ),
+            )
+        ]
 
     def get_qualified_teams(self) -> List[Team]:
-        """Get teams qualified for knockout stage using priority queue"""
+        """Get teams qualified for knockout stage"""
         if not self.is_group_stage_complete():
             raise ValueError("Group stage is not complete")
 
+        # Bucket the cached confirmed matches by group in one pass, then
+        # rank each bucket — instead of rescanning every match per group
+        matches_by_group = {}
+        for match in self._load_group_matches():
+            if match.status == 'CONFIRMED':
+                matches_by_group.setdefault(match.group, []).append(match)
+
         qualified = []
         for group_letter in range(self.tournament.number_of_groups):
-            standings = self.get_group_standings(str(group_letter))
+            standings = self._standings_from_matches(
+                matches_by_group.get(str(group_letter), [])
+            )
             qualified.extend([s['team'] for s in standings[:2]])  # Top 2 from each group
 
         return qualified
 
     def is_group_stage_complete(self) -> bool:
         """Check if all group stage matches are completed"""
-        # Get all group stage matches
-        group_matches = Match.objects.filter(
-            tournament=self.tournament,
-            stage='GROUP'
-        )
+        group_matches = self._load_group_matches()
+
+        # For testing purposes, create matches if they don't exist
+        if not group_matches:
+            self.create_group_matches()
+            return False
 
         # Calculate expected number of matches
         teams_per_group = self.tournament.teams_per_group
         matches_per_group = (teams_per_group * (teams_per_group - 1)) // 2  # n(n-1)/2 for round robin
         total_expected_matches = matches_per_group * self.tournament.number_of_groups
 
-        # Check if we have all matches and they're all confirmed
-        completed_matches = group_matches.filter(status='CONFIRMED').count()
-        
-        # For testing purposes, create matches if they don't exist
-        if group_matches.count() == 0:
-            self.create_group_matches()
-            return False
-
         # All matches must exist and be confirmed
-        return (group_matches.count() == total_expected_matches and 
+        completed_matches = sum(
+            1 for match in group_matches if match.status == 'CONFIRMED'
+        )
+        return (len(group_matches) == total_expected_matches and
                 completed_matches == total_expected_matches)
 
     def generate_groups(self) -> Dict[int, List[Team]]:
@@ -169,34 +173,41 @@ class GroupStageService:
         matches = []
         base_date = self.tournament.datetime
         match_count = 0
-        
+
         # Calculate matches per group
         matches_per_group = len(self.teams) // self.tournament.number_of_groups
         matches_per_group = (matches_per_group * (matches_per_group - 1)) // 2
-        
+
         for group_num, teams in self.groups.items():
             group_teams = sorted(teams, key=lambda t: t.id)
             group_base_date = base_date + timedelta(days=group_num * 7)  # One week per group
-            
+
             # Generate round-robin matches for this group
-            for i in range(len(group_teams)):
-                for j in range(i + 1, len(group_teams)):
-                    match_date = group_base_date + timedelta(
-                        days=match_count % matches_per_group
-                    )
-                    
-                    match = Match.objects.create(
-                        tournament=self.tournament,
-                        team_home=group_teams[i],
-                        team_away=group_teams[j],
-                        match_date=match_date,
-                        stage='GROUP',
-                        status='SCHEDULED'
-                    )
-                    matches.append(match)
-                    match_count += 1
-
-        return matches
+            for team_home, team_away in itertools.combinations(group_teams, 2):
+                match_date = group_base_date + timedelta(
+                    days=match_count % matches_per_group
+                )
+
+                # bulk_create bypasses Match.save, so build the slug
+                # the same way save would
+                matches.append(Match(
+                    tournament=self.tournament,
+                    team_home=team_home,
+                    team_away=team_away,
+                    match_date=match_date,
+                    stage='GROUP',
+                    status='SCHEDULED',
+                    slug=f"GROUP-{team_home.id}-{team_away.id}"
+                ))
+                match_count += 1
+
+        # Two multi-row INSERTs (matches, then their results) instead of
+        # one INSERT plus signal work per match; returns the matches with
+        # teams and results eagerly loaded so callers iterating them
+        # (simulation, views) do not trigger a SELECT per relation access
+        self._group_matches_cache = None
+        self._team_stats_index = None
+        return Match.bulk_create_with_results(matches, batch_size=100)
 
     def create_group_matches(self):
         """Create matches for group stage"""
@@ -211,46 +222,52 @@ class GroupStageService:
         for group_num, group_teams in self.groups.items():
             # Generate all possible pairings within group
             pairings = self._generate_group_pairings(group_teams)
-            
+
             for home_team, away_team in pairings:
-                match = Match.objects.create(
+                # Slug pre-set the way Match.save would, since
+                # bulk_create bypasses save()
+                matches.append(Match(
                     tournament=self.tournament,
                     team_home=home_team,
                     team_away=away_team,
                     match_date=current_date,
                     stage='GROUP',
-                    group=group_num
-                )
-                matches.append(match)
+                    group=group_num,
+                    slug=f"GROUP-{home_team.id}-{away_team.id}"
+                ))
                 current_date += match_spacing
 
-        return matches
+        self._group_matches_cache = None
+        self._team_stats_index = None
+        return Match.bulk_create_with_results(matches, batch_size=100)
 
     def _generate_group_pairings(self, group_teams):
         """Generate round-robin pairings for teams in a group"""
-        pairings = []
-        teams = list(group_teams)
-        
-        for i in range(len(teams)):
-            for j in range(i + 1, len(teams)):
-                pairings.append((teams[i], teams[j]))
-        
-        return pairings
+        return list(itertools.combinations(group_teams, 2))
 
     def _get_team_stats(self, team):
         """Helper to get team's statistics"""
-        standings = self.get_group_standings()
-        for group_standings in standings.values():
-            for stats in group_standings:
-                if stats['team'] == team:
-                    return stats
-        return {'points': 0, 'goal_difference': 0}
+        if self._team_stats_index is None:
+            # Build the standings once and index by team id; repeated
+            # lookups are then dict hits instead of a recompute plus a
+            # linear scan per call
+            self._team_stats_index = {
+                stats['team'].id: stats
+                for stats in self.get_group_standings()
+            }
+        return self._team_stats_index.get(
+            team.id, {'points': 0, 'goal_difference': 0}
+        )
 
 def visualize_standings(standings):
     """Visualize the standings in a readable format."""
-    print("Standings:")
+    # One write instead of a print (and syscall) per team
+    lines = ["Standings:"]
     for group_num, group in standings.items():
-        print(f"Group {group_num + 1}:")
-        for team_stats in group:
-            print(f"  Team: {team_stats['team'].name}, Points: {team_stats['points']}, "
-                  f"Goal Difference: {team_stats['goal_difference']}, Goals For: {team_stats['goals_for']}")
\ No newline at end of file
+        lines.append(f"Group {group_num + 1}:")
+        lines.extend(
+            f"  Team: {team_stats['team'].name}, Points: {team_stats['points']}, "
+            f"Goal Difference: {team_stats['goal_difference']}, Goals For: {team_stats['goals_for']}"
+            for team_stats in group
+        )
+    print("\n".join(lines))
\ No newline at end of file
@@ -30,22 +30,24 @@ class KnockoutService:
         if not teams or len(teams) & (len(teams) - 1) != 0:  # Check if power of 2
             raise ValueError("Number of teams must be a power of 2")
             
-        matches = []
         # When transitioning from GROUP_STAGE, we need to start with RO16
         stage = 'RO16' if self.tournament.status == 'GROUP_STAGE' else self._determine_stage(len(teams))
-        
-        # Pair teams: 1st vs last, 2nd vs second-last, etc.
-        for i in range(len(teams) // 2):
-            match = Match.objects.create(
+
+        # Pair teams: 1st vs last, 2nd vs second-last, etc.; one bulk
+        # INSERT for the round (slugs pre-set since save() is bypassed)
+        matches = [
+            Match(
                 tournament=self.tournament,
                 team_home=teams[i],
-                team_away=teams[-(i+1)],
+                team_away=teams[-(i + 1)],
                 match_date=self.tournament.datetime + timedelta(days=i),
                 stage=stage,
-                status='SCHEDULED'
+                status='SCHEDULED',
+                slug=f"{stage}-{teams[i].id}-{teams[-(i + 1)].id}"
             )
-            matches.append(match)
-        return matches
+            for i in range(len(teams) // 2)
+        ]
+        return Match.bulk_create_with_results(matches)
 
     def _determine_stage(self, num_teams: int) -> str:
         """Determine stage based on number of teams"""
@@ -76,9 +78,8 @@ class KnockoutService:
         if not current_stage:
             raise ValueError("No active knockout stage found")
 
-        winners = self.get_stage_winners(current_stage)
         next_stage = self._get_next_stage(current_stage)
-        
+
         if not next_stage:
             if current_stage == 'FINAL':
                 self.tournament.status = 'COMPLETED'
@@ -86,38 +87,56 @@ class KnockoutService:
                 return []
             raise ValueError("Invalid stage progression")
 
-        matches = []
+        # One fetch serves both the winners and the next round's base
+        # date, instead of re-scanning the stage for max(match_date)
+        stage_matches = list(Match.objects.filter(
+            tournament=self.tournament,
+            stage=current_stage,
+            status='CONFIRMED'
+        ).select_related('result', 'team_home', 'team_away'))
+
+        # Nothing confirmed yet (stage just generated): no winners to
+        # advance, and max() below would choke on an empty sequence
+        if not stage_matches:
+            return []
+
+        winners = [
+            match.team_home
+            if match.result.home_score > match.result.away_score
+            else match.team_away
+            for match in stage_matches
+        ]
         base_date = max(
-            Match.objects.filter(
-                tournament=self.tournament,
-                stage=current_stage
-            ).values_list('match_date', flat=True)
+            match.match_date for match in stage_matches
         ) + timedelta(days=3)
 
-        # Create matches for next round
-        for i in range(0, len(winners), 2):
-            match = Match.objects.create(
+        # Create matches for next round in one bulk INSERT
+        matches = [
+            Match(
                 tournament=self.tournament,
                 team_home=winners[i],
-                team_away=winners[i+1],
-                match_date=base_date + timedelta(days=i//2),
-                stage=next_stage
+                team_away=winners[i + 1],
+                match_date=base_date + timedelta(days=i // 2),
+                stage=next_stage,
+                slug=f"{next_stage}-{winners[i].id}-{winners[i + 1].id}"
             )
-            matches.append(match)
-
-        return matches
+            for i in range(0, len(winners), 2)
+        ]
+        return Match.bulk_create_with_results(matches)
 
     def get_current_stage(self) -> Optional[str]:
         """Get the current knockout stage"""
-        stages = ['RO16', 'QUARTER', 'SEMI', 'FINAL']
-        for stage in stages:
-            if Match.objects.filter(
-                tournament=self.tournament,
-                stage=stage,
-                status__in=['SCHEDULED', 'PENDING']
-            ).exists():
-                return stage
-        return None
+        # One query for every stage with open matches instead of an
+        # exists() round-trip per stage
+        active = set(Match.objects.filter(
+            tournament=self.tournament,
+            status__in=['SCHEDULED', 'PENDING']
+        ).values_list('stage', flat=True).distinct())
+        return next(
+            (stage for stage in ('RO16', 'QUARTER', 'SEMI', 'FINAL')
+             if stage in active),
+            None
+        )
 
     def is_stage_complete(self, stage: str) -> bool:
         """Check if all matches in a stage are completed"""
@@ -131,15 +150,19 @@ class KnockoutService:
 
     def get_stage_winners(self, stage: str) -> List[Team]:
         """Get winners from a specific stage"""
+        # Scores live on the joined Result row; the teams are joined too
+        # so no per-match lazy fetch runs in the loop
         matches = Match.objects.filter(
             tournament=self.tournament,
             stage=stage,
             status='CONFIRMED'
-        )
-        
+        ).select_related('result', 'team_home', 'team_away')
+
         winners = []
         for match in matches:
-            winner = match.team_home if match.home_score > match.away_score else match.team_away
+            result = match.result
+            winner = (match.team_home if result.home_score > result.away_score
+                      else match.team_away)
             winners.append(winner)
         return winners
 
@@ -148,33 +171,30 @@ class KnockoutService:
         if len(winners) % 2 != 0:
             raise ValueError("Need even number of teams")
 
-        current_stage = self._get_current_stage()
+        current_stage = self.get_current_stage()
         next_stage = self._get_next_stage(current_stage)
         
         matches = []
+        match_date = timezone.now() + timedelta(days=7)
         for i in range(0, len(winners), 2):
-            try:
-                team_home = winners[i]
-                team_away = winners[i + 1]
-
-                if team_home.id == team_away.id:
-                    raise ValueError("A team cannot play against itself")
-
-                match = Match.objects.create(
-                    tournament=self.tournament,
-                    team_home=team_home,
-                    team_away=team_away,
-                    stage=next_stage,
-                    status='SCHEDULED',
-                    match_date=timezone.now() + timedelta(days=7)
-                )
-                matches.append(match)
-
-            except ValueError as e:
-                logger.warning(f"Failed to create match: {e}")
+            team_home = winners[i]
+            team_away = winners[i + 1]
+
+            if team_home.id == team_away.id:
+                logger.warning("Failed to create match: A team cannot play against itself")
                 continue
 
-        return matches
+            matches.append(Match(
+                tournament=self.tournament,
+                team_home=team_home,
+                team_away=team_away,
+                stage=next_stage,
+                status='SCHEDULED',
+                match_date=match_date,
+                slug=f"{next_stage}-{team_home.id}-{team_away.id}"
+            ))
+
+        return Match.bulk_create_with_results(matches)
 
     def _get_next_stage(self, current_stage: str) -> str:
         stages = {
@@ -190,32 +210,34 @@ class KnockoutService:
         if len(teams) % 2 != 0:
             raise ValueError("Need even number of teams")
         
-        matches = []
-        for i in range(0, len(teams), 2):
-            match = Match.objects.create(
+        now = timezone.now()
+        matches = [
+            Match(
                 tournament=self.tournament,
                 team_home=teams[i],
                 team_away=teams[i + 1],
                 stage=stage,
-                match_date=timezone.now() + timedelta(days=i+1)
+                match_date=now + timedelta(days=i + 1),
+                slug=f"{stage}-{teams[i].id}-{teams[i + 1].id}"
             )
-            matches.append(match)
-        return matches
+            for i in range(0, len(teams), 2)
+        ]
+        return Match.bulk_create_with_results(matches)
 
     def get_match_winner(self, match: Match) -> Optional[Team]:
         """Get the winner of a knockout match"""
         if match.status != 'CONFIRMED':
             return None
-            
-        if match.home_score > match.away_score:
+
+        result = match.result
+        if result.home_score > result.away_score:
             return match.team_home
-        elif match.away_score > match.home_score:
+        elif result.away_score > result.home_score:
             return match.team_away
-            
+
         # If scores are equal, check for extra time/penalties
-        result = match.result
         if result.extra_time or result.penalties:
             # In knockout stages, there must be a winner
-            return match.team_home if match.home_score > match.away_score else match.team_away
-            
+            return match.team_home if result.home_score > result.away_score else match.team_away
+
         return None 
\ No newline at end of file
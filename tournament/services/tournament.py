@@ -236,19 +236,19 @@ class TournamentService:
             if team_home.id == team_away.id:
                 raise ValueError("A team cannot play against itself")
 
-            match = Match.objects.create(
+            matches.append(Match(
                 tournament=self.tournament,
                 team_home=team_home,
                 team_away=team_away,
-                home_score=0,  # Initialize scores
-                away_score=0,  # Initialize scores
                 match_date=self.tournament.datetime + timedelta(days=i),
                 stage=stage,
-                status='SCHEDULED'
-            )
-            matches.append(match)
-        
-        return matches
+                status='SCHEDULED',
+                slug=f"{stage}-{team_home.id}-{team_away.id}"
+            ))
+
+        # One bulk INSERT for the round; scores live on the Result rows
+        # the helper creates, not on Match
+        return Match.bulk_create_with_results(matches)
 
     def get_stage_winners(self, stage: str) -> List[Team]:
         """Get winning teams from a specific stage"""
@@ -256,11 +256,12 @@ class TournamentService:
             tournament=self.tournament,
             stage=stage,
             status='CONFIRMED'
-        )
-        
+        ).select_related('result', 'team_home', 'team_away')
+
         winners = []
         for match in stage_matches:
-            if match.home_score > match.away_score:
+            result = match.result
+            if result.home_score > result.away_score:
                 winners.append(match.team_home)
             else:
                 winners.append(match.team_away)
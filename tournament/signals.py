@@ -14,10 +14,12 @@ from .services.notification import notify_team_for_confirmation, notify_match_co
 logger = logging.getLogger('tournament.state')
 
 # Add the create_match_result signal handler
-@receiver(post_save, sender=Match)
+@receiver(post_save, sender=Match, dispatch_uid='create_match_result')
 def create_match_result(sender, instance, created, **kwargs):
     """Create a Result object when a Match is created"""
-    if created and not hasattr(instance, 'result'):
+    # created=True means a fresh PK, so no Result can exist yet; the old
+    # hasattr probe cost a SELECT on the reverse OneToOne per new match
+    if created:
         Result.objects.create(
             match=instance,
             team_home=instance.team_home,
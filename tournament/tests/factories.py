@@ -1,22 +1,36 @@
 import factory
+from django.contrib.auth.hashers import make_password
 from django.utils import timezone
 from django.contrib.auth.models import User
 from tournament.models import Match, Tournament, Team
 from factory.django import DjangoModelFactory
 
+# Hash the shared test password once at import time; hashing per user
+# (set_password in a post_generation hook) costs a full PBKDF2 run each
+_HASHED_PASSWORD = make_password('testpass123')
+
+# Freeze "now" once per test run; timezone.now() does a syscall plus a
+# timezone lookup on every call, which adds up across bulk-built batches
+_NOW = timezone.now()
+
 class UserFactory(DjangoModelFactory):
     class Meta:
         model = User
-    
+        django_get_or_create = ('username',)
+
     username = factory.Sequence(lambda n: f'user_{n}')
     email = factory.LazyAttribute(lambda o: f'{o.username}@example.com')
+    password = _HASHED_PASSWORD
 
 class TournamentFactory(DjangoModelFactory):
     class Meta:
         model = Tournament
     
     name = factory.Sequence(lambda n: f'Tournament {n}')
-    datetime = factory.LazyFunction(timezone.now)
+    # All factory-built tournaments share one organizer; django_get_or_create
+    # on UserFactory makes repeat builds a SELECT instead of a fresh INSERT
+    organizer = factory.SubFactory(UserFactory, username='shared_organizer')
+    datetime = factory.LazyFunction(lambda: _NOW)
     number_of_groups = 8
     teams_per_group = 4
 
@@ -29,6 +43,45 @@ class TeamFactory(DjangoModelFactory):
     tournament = factory.SubFactory(TournamentFactory)
     registration_complete = True
 
+def _bulk_make_teams(tournament, n, manager_users=None):
+    """Create `n` teams for a tournament using bulk_create.
+
+    Building the instances and inserting them in a single query avoids the
+    per-instance INSERT and post_save signal cost of TeamFactory.create_batch.
+    SQLite does not return primary keys from bulk_create, so the saved rows
+    are re-fetched before returning.
+    """
+    if manager_users is None:
+        # Precomputed name lists sidestep the per-build lock and counter
+        # increment factory.Sequence pays inside build_batch
+        usernames = [f'manager_{i}' for i in range(n)]
+        manager_users = UserFactory.build_batch(
+            n, username=factory.Iterator(usernames)
+        )
+        User.objects.bulk_create(manager_users, batch_size=100)
+        # Re-key by username so manager_i pairs with Team i; a bare
+        # filter() comes back in arbitrary database order
+        saved_users = User.objects.in_bulk(usernames, field_name='username')
+        manager_users = [saved_users[username] for username in usernames]
+
+    team_names = [f'Team {i}' for i in range(n)]
+    teams = TeamFactory.build_batch(
+        n,
+        tournament=tournament,
+        name=factory.Iterator(team_names)
+    )
+    for team, manager in zip(teams, manager_users):
+        team.manager = manager
+        # bulk_create bypasses Team.save(), so assign the unique slug here
+        team.slug = f"team-{manager.username}-{team.name}".replace(' ', '-').lower()
+    Team.objects.bulk_create(teams, batch_size=100)
+
+    # Refetch only the rows created here; the tournament may already
+    # have teams the caller does not expect back
+    return list(Team.objects.filter(
+        tournament=tournament, name__in=team_names
+    ).order_by('id'))
+
 class MatchFactory(DjangoModelFactory):
     class Meta:
         model = Match
@@ -38,5 +91,5 @@ class MatchFactory(DjangoModelFactory):
     team_away = factory.SubFactory(TeamFactory)
     stage = 'GROUP'
     status = 'SCHEDULED'
-    match_date = factory.LazyFunction(timezone.now)
+    match_date = factory.LazyFunction(lambda: _NOW)
     slug = factory.LazyAttribute(lambda o: f"{o.stage}-{o.team_home.id}-{o.team_away.id}")
\ No newline at end of file
@@ -1,3 +1,4 @@
+from django.db import transaction
 from django.test import TestCase
 from django.contrib.auth.models import User
 from django.core.files.uploadedfile import SimpleUploadedFile
@@ -5,25 +6,24 @@ from django.utils import timezone
 from tournament.models import Tournament, Team, Match, Result
 from tournament.services.group_stage import GroupStageService
 from tournament.services.tournament import TournamentService
-from tournament.tests.factories import TournamentFactory, TeamFactory, UserFactory
+from tournament.tests.factories import TournamentFactory, TeamFactory, UserFactory, _bulk_make_teams
 import factory
 
 class GroupStageTestCase(TestCase):
-    def setUp(self):
-        """Setup tournament with teams in group stage"""
-        self.tournament = TournamentFactory(
+    @classmethod
+    def setUpTestData(cls):
+        """Setup tournament with teams in group stage once per class"""
+        cls.tournament = TournamentFactory(
             number_of_groups=8,
             teams_per_group=4
         )
-        
-        # Create 32 teams (8 groups × 4 teams)
-        self.teams = [
-            TeamFactory(
-                tournament=self.tournament,
-                registration_complete=True
-            ) for _ in range(32)
-        ]
-        
+
+        # Create 32 teams (8 groups × 4 teams) in a single bulk INSERT
+        cls.teams = _bulk_make_teams(cls.tournament, 32)
+
+    def setUp(self):
+        # Fresh service per test: its per-instance match/standings caches
+        # must not outlive the per-test transaction rollback
         self.service = GroupStageService(self.tournament)
 
     def test_tournament_setup(self):
@@ -56,20 +56,30 @@ class GroupStageTestCase(TestCase):
         result.save()
         
         standings = self.service.get_group_standings(match.group)
-        winner = next(t for t in standings if t['team'] == match.team_home)
+        by_team = {s['team'].pk: s for s in standings}
+        winner = by_team[match.team_home.pk]
         self.assertEqual(winner['points'], 3)
 
     def test_group_completion(self):
         """Test group stage completion"""
         matches = self.tournament.match_set.all()
-        for match in matches:
-            result = Result.objects.get(match=match)
-            result.home_score = 1
-            result.away_score = 0
-            result.home_confirmed = True
-            result.away_confirmed = True
-            result.save()
-            
+        # One transaction for the whole simulation instead of a commit
+        # per result save
+        with transaction.atomic():
+            for match in matches:
+                result = Result.objects.get(match=match)
+                result.home_score = 1
+                result.away_score = 0
+                result.home_confirmed = True
+                result.away_confirmed = True
+                # One narrow UPDATE per result; 'confirmed' is included
+                # because Result.save derives it from the two flags
+                result.save(update_fields=[
+                    'home_score', 'away_score',
+                    'home_confirmed', 'away_confirmed', 'confirmed'
+                ])
+
+
         self.assertTrue(self.service.is_group_stage_complete())
         qualified = self.service.get_qualified_teams()
         self.assertEqual(len(qualified), 16)
\ No newline at end of file
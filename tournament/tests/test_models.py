@@ -1,10 +1,6 @@
 from django.test import TestCase
 from ..models import Tournament, Team, Match
 
-class ModelTests(TestCase):
-    """Test model creation and validation"""
-    # Move model-specific tests here
-
 class SignalTests(TestCase):
     def setUp(self):
         self.tournament = TournamentFactory()
@@ -3,6 +3,6 @@ from django.test import TestCase
 from ..services.group_stage import GroupStageService
 from ..services.knockout import KnockoutService
 
-class ServiceTests(TestCase):
-    """Test service layer functionality"""
-    # Move service-specific tests here
\ No newline at end of file
+# Service behaviour is covered by test_group_stage and test_integration;
+# the empty ServiceTests placeholder class was removed so the runner does
+# not discover a bodyless TestCase.
\ No newline at end of file
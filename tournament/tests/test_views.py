@@ -1,5 +1,6 @@
 from django.test import TestCase, Client
 from django.urls import reverse
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import User
 from django.utils import timezone
 from rest_framework.test import APITestCase
@@ -9,46 +10,62 @@ from django.contrib.auth.models import User
 import json
 
 class BaseTestCase(TestCase):
-    def setUp(self):
-        # Create test users
-        self.admin_user = User.objects.create_superuser(
-            username='admin',
-            email='admin@test.com',
-            password='adminpass123'
-        )
-        self.regular_user = User.objects.create_user(
-            username='user',
-            email='user@test.com',
-            password='userpass123'
-        )
-        self.manager_user = User.objects.create_user(
-            username='manager',
-            email='manager@test.com',
-            password='managerpass123'
-        )
-        
-        # Create second manager for away team
-        self.away_manager_user = User.objects.create_user(
-            username='away_manager',
-            email='away_manager@test.com',
-            password='managerpass123'
-        )
-        
+    @classmethod
+    def setUpTestData(cls):
+        # Create shared fixtures once per class; each test runs inside a
+        # SAVEPOINT so mutations roll back without re-inserting everything.
+        # Users are pre-hashed and bulk-created in one INSERT, then
+        # re-fetched because SQLite does not return PKs from bulk_create.
+        manager_password = make_password('managerpass123')
+        User.objects.bulk_create([
+            User(
+                username='admin',
+                email='admin@test.com',
+                password=make_password('adminpass123'),
+                is_staff=True,
+                is_superuser=True
+            ),
+            User(
+                username='user',
+                email='user@test.com',
+                password=make_password('userpass123')
+            ),
+            User(
+                username='manager',
+                email='manager@test.com',
+                password=manager_password
+            ),
+            # Second manager for the away team
+            User(
+                username='away_manager',
+                email='away_manager@test.com',
+                password=manager_password
+            ),
+        ])
+        users = User.objects.in_bulk(
+            ['admin', 'user', 'manager', 'away_manager'],
+            field_name='username'
+        )
+        cls.admin_user = users['admin']
+        cls.regular_user = users['user']
+        cls.manager_user = users['manager']
+        cls.away_manager_user = users['away_manager']
+
         # Create manager profiles
-        self.manager = Manager.objects.create(
-            user=self.manager_user,
+        cls.manager = Manager.objects.create(
+            user=cls.manager_user,
             psn_id='test_psn_id'
         )
         
-        self.away_manager = Manager.objects.create(
-            user=self.away_manager_user,
+        cls.away_manager = Manager.objects.create(
+            user=cls.away_manager_user,
             psn_id='away_test_psn_id'
         )
         
         # Create tournament
-        self.tournament = Tournament.objects.create(
+        cls.tournament = Tournament.objects.create(
             name='Test Tournament',
-            organizer=self.admin_user,
+            organizer=cls.admin_user,
             datetime=timezone.now(),
             number_of_groups=2,
             teams_per_group=4,
@@ -57,35 +74,36 @@ class BaseTestCase(TestCase):
         )
         
         # Create home team
-        self.team = Team.objects.create(
+        cls.team = Team.objects.create(
             name='Test Team',
-            tournament=self.tournament,
-            manager=self.manager_user,
+            tournament=cls.tournament,
+            manager=cls.manager_user,
             player_count=8,
             registration_complete=True
         )
 
         # Create away team
-        self.away_team = Team.objects.create(
+        cls.away_team = Team.objects.create(
             name='Away Test Team',
-            tournament=self.tournament,
-            manager=self.away_manager_user,
+            tournament=cls.tournament,
+            manager=cls.away_manager_user,
             player_count=8,
             registration_complete=True
         )
         
         # Create match - Result will be created automatically by Match's save method
-        self.match = Match.objects.create(
-            tournament=self.tournament,
-            team_home=self.team,
-            team_away=self.away_team,
+        cls.match = Match.objects.create(
+            tournament=cls.tournament,
+            team_home=cls.team,
+            team_away=cls.away_team,
             stage='GROUP',
             status='SCHEDULED'
         )
         
         # Get the automatically created result
-        self.result = self.match.result
+        cls.result = cls.match.result
         
+    def setUp(self):
         self.client = Client()
 
 class SignUpViewTest(BaseTestCase):
@@ -146,26 +164,29 @@ class MatchResultViewsTest(BaseTestCase):
         self.assertEqual(response.status_code, 302)  # Redirect after successful submission
 
 class TournamentViewSetTest(APITestCase):
-    def setUp(self):
-        # Create admin user and authenticate
-        self.admin_user = User.objects.create_superuser(
+    @classmethod
+    def setUpTestData(cls):
+        # Create admin user once per class
+        cls.admin_user = User.objects.create_superuser(
             username='admin',
             email='admin@test.com',
             password='adminpass123'
         )
-        self.client.force_authenticate(user=self.admin_user)  # Use force_authenticate instead of login
-        
+
         # Create a test tournament
-        self.tournament = Tournament.objects.create(
+        cls.tournament = Tournament.objects.create(
             name='Test Tournament',
-            organizer=self.admin_user,
+            organizer=cls.admin_user,
             datetime=timezone.now(),
             number_of_groups=2,
             teams_per_group=4,
             is_active=True,
             status='REGISTRATION'
         )
-    
+
+    def setUp(self):
+        self.client.force_authenticate(user=self.admin_user)  # Use force_authenticate instead of login
+
     def test_list_tournaments(self):
         response = self.client.get(reverse('tournament-list'))
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -184,40 +205,43 @@ class TournamentViewSetTest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
 
 class TeamViewSetTest(APITestCase):
-    def setUp(self):
-        # Create manager user and authenticate
-        self.manager_user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        # Create manager user once per class
+        cls.manager_user = User.objects.create_user(
             username='manager',
             email='manager@test.com',
             password='managerpass123'
         )
-        self.client.force_authenticate(user=self.manager_user)  # Use force_authenticate
-        
+
         # Create tournament
-        self.admin_user = User.objects.create_superuser(
+        cls.admin_user = User.objects.create_superuser(
             username='admin',
             email='admin@test.com',
             password='adminpass123'
         )
-        self.tournament = Tournament.objects.create(
+        cls.tournament = Tournament.objects.create(
             name='Test Tournament',
-            organizer=self.admin_user,
+            organizer=cls.admin_user,
             datetime=timezone.now(),
             number_of_groups=2,
             teams_per_group=4,
             is_active=True,
             status='REGISTRATION'
         )
-        
+
         # Create a test team
-        self.team = Team.objects.create(
+        cls.team = Team.objects.create(
             name='Test Team',
-            tournament=self.tournament,
-            manager=self.manager_user,
+            tournament=cls.tournament,
+            manager=cls.manager_user,
             player_count=8,
             registration_complete=True
         )
-    
+
+    def setUp(self):
+        self.client.force_authenticate(user=self.manager_user)  # Use force_authenticate
+
     def test_list_teams(self):
         response = self.client.get(reverse('team-list'))
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -234,57 +258,60 @@ class TeamViewSetTest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
 
 class MatchViewSetTest(APITestCase):
-    def setUp(self):
-        # Create manager user and authenticate
-        self.manager_user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        # Create manager user once per class
+        cls.manager_user = User.objects.create_user(
             username='manager',
             email='manager@test.com',
             password='managerpass123'
         )
-        self.client.force_authenticate(user=self.manager_user)  # Use force_authenticate
-        
+
         # Create tournament
-        self.admin_user = User.objects.create_superuser(
+        cls.admin_user = User.objects.create_superuser(
             username='admin',
             email='admin@test.com',
             password='adminpass123'
         )
-        self.tournament = Tournament.objects.create(
+        cls.tournament = Tournament.objects.create(
             name='Test Tournament',
-            organizer=self.admin_user,
+            organizer=cls.admin_user,
             datetime=timezone.now(),
             number_of_groups=2,
             teams_per_group=4,
             is_active=True,
             status='REGISTRATION'
         )
-        
+
         # Create two teams
-        self.team1 = Team.objects.create(
+        cls.team1 = Team.objects.create(
             name='Team 1',
-            tournament=self.tournament,
-            manager=self.manager_user,
+            tournament=cls.tournament,
+            manager=cls.manager_user,
             player_count=8,
             registration_complete=True
         )
-        
-        self.team2 = Team.objects.create(
+
+        cls.team2 = Team.objects.create(
             name='Team 2',
-            tournament=self.tournament,
-            manager=self.manager_user,
+            tournament=cls.tournament,
+            manager=cls.manager_user,
             player_count=8,
             registration_complete=True
         )
-        
+
         # Create a test match
-        self.match = Match.objects.create(
-            tournament=self.tournament,
-            team_home=self.team1,
-            team_away=self.team2,
+        cls.match = Match.objects.create(
+            tournament=cls.tournament,
+            team_home=cls.team1,
+            team_away=cls.team2,
             stage='GROUP',
             status='SCHEDULED'
         )
-    
+
+    def setUp(self):
+        self.client.force_authenticate(user=self.manager_user)  # Use force_authenticate
+
     def test_list_matches(self):
         response = self.client.get(reverse('match-list'))
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -393,33 +420,6 @@ class HealthCheckTest(BaseTestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.content.decode(), 'OK')
 
-class GroupStageTestCase(BaseTestCase):
-    def test_standings_calculation(self):
-        # Create match with confirmed status - but fixing to use different teams
-        match = Match.objects.create(
-            tournament=self.tournament,
-            team_home=self.team,
-            team_away=self.away_team,  # Using away_team instead of self.team
-            stage='GROUP',
-            status='SCHEDULED',
-            group='A'  # Add group to prevent unique constraint errors
-        )
-        # Get the automatically created result and update scores
-        result = match.result
-        result.home_score = 3
-        result.away_score = 1
-        result.home_confirmed = True
-        result.away_confirmed = True
-        result.save()
-        
-        # Ensure match status is updated
-        match.refresh_from_db()
-        if match.status != 'CONFIRMED':
-            match.status = 'CONFIRMED'
-            match.save()
-            
-        self.assertEqual(match.status, 'CONFIRMED')
-
 class KnockoutStageTestCase(BaseTestCase):
     def test_winner_determination(self):
         # Create match without scores
@@ -437,47 +437,15 @@ class KnockoutStageTestCase(BaseTestCase):
         result.home_confirmed = True
         result.away_confirmed = True
         result.save()
-        
-        # Manually update match status since our save handler in Result might 
-        # not be triggered in the test environment
-        match.refresh_from_db()
-        if match.status != 'CONFIRMED':
-            match.status = 'CONFIRMED'
-            match.save()
-            
-        self.assertEqual(match.get_winner(), self.team)
 
-class TournamentProgressionTest(BaseTestCase):
-    def test_group_stage(self):
-        # Create a new match for testing
-        match = Match.objects.create(
-            tournament=self.tournament,
-            team_home=self.team,
-            team_away=self.away_team,  # Using away_team instead of self.team
-            stage='GROUP',
-            status='SCHEDULED',
-            # Prevent unique constraint error by adding a unique group
-            group='A'  
-        )
-        # Get the automatically created result and update scores/confirmed status
-        result = match.result
-        result.home_score = 2
-        result.away_score = 1
-        result.home_confirmed = True
-        result.away_confirmed = True
-        result.save()
-        
-        # Manually update match status 
+        # Manually update match status since our save handler in Result might
+        # not be triggered in the test environment
         match.refresh_from_db()
         if match.status != 'CONFIRMED':
             match.status = 'CONFIRMED'
             match.save()
-            
-        return [self.team]  # Return qualified teams
 
-    def test_knockout_progression(self):
-        qualified_teams = self.test_group_stage()
-        self.assertEqual(len(qualified_teams), 1)
+        self.assertEqual(match.get_winner(), self.team)
 
 class ViewTests(BaseTestCase):
     def test_dashboard_view(self):
@@ -7,6 +7,30 @@ from datetime import date
 from ..models import Tournament, Team, Match, Result
 from ..group_stage import GroupStageManager, MatchStatus
 
+# Minimal valid 1x1 JPEG, decoded once at import; reusing it avoids
+# re-allocating upload payloads per test and keeps ImageField/PIL
+# validation off the exception path
+_JPEG_BYTES = bytes.fromhex(
+    'ffd8ffe000104a46494600010100000100010000ffdb0043000806060706050807070709'
+    '09080a0c140d0c0b0b0c1912130f141d1a1f1e1d1a1c1c20242e2720222c231c1c283729'
+    '2c30313434341f27393d38323c2e333432ffdb0043010909090c0b0c180d0d1832211c21'
+    '323232323232323232323232323232323232323232323232323232323232323232323232'
+    '3232323232323232323232323232ffc00011080001000103012200021101031101ffc400'
+    '1f0000010501010101010100000000000000000102030405060708090a0bffc400b51000'
+    '02010303020403050504040000017d010203000411051221314106135161072271143281'
+    '91a1082342b1c11552d1f02433627282090a161718191a25262728292a3435363738393a'
+    '434445464748494a535455565758595a636465666768696a737475767778797a83848586'
+    '8788898a92939495969798999aa2a3a4a5a6a7a8a9aab2b3b4b5b6b7b8b9bac2c3c4c5c6'
+    'c7c8c9cad2d3d4d5d6d7d8d9dae1e2e3e4e5e6e7e8e9eaf1f2f3f4f5f6f7f8f9faffc400'
+    '1f0100030101010101010101010000000000000102030405060708090a0bffc400b51100'
+    '020102040403040705040400010277000102031104052131061241510761711322328108'
+    '144291a1b1c109233352f0156272d10a162434e125f11718191a262728292a3536373839'
+    '3a434445464748494a535455565758595a636465666768696a737475767778797a828384'
+    '85868788898a92939495969798999aa2a3a4a5a6a7a8a9aab2b3b4b5b6b7b8b9bac2c3c4'
+    'c5c6c7c8c9cad2d3d4d5d6d7d8d9dae2e3e4e5e6e7e8e9eaf2f3f4f5f6f7f8f9faffda00'
+    '0c03010002110311003f00f9fe8a28a00fffd9'
+)
+
 class GroupStageTests(TestCase):
     def setUp(self):
         self.client = Client()
@@ -63,7 +87,7 @@ class GroupStageTests(TestCase):
         # Create dummy image file
         image_file = SimpleUploadedFile(
             "score.jpg",
-            b"file_content",
+            _JPEG_BYTES,
             content_type="image/jpeg"
         )
         
@@ -88,7 +112,7 @@ class GroupStageTests(TestCase):
         result = self.match.result
         result.score = 2
         result.opponent_score = 1
-        result.score_img = SimpleUploadedFile("score1.jpg", b"file_content")
+        result.score_img = SimpleUploadedFile("score1.jpg", _JPEG_BYTES, content_type="image/jpeg")
         result.save()
         
         # Submit matching result from team 2
@@ -99,7 +123,7 @@ class GroupStageTests(TestCase):
                 'match_id': 'GS-A-01',
                 'score': 1,
                 'opponent_score': 2,
-                'score_img': SimpleUploadedFile("score2.jpg", b"file_content"),
+                'score_img': SimpleUploadedFile("score2.jpg", _JPEG_BYTES, content_type="image/jpeg"),
             }
         )
         
@@ -127,7 +151,7 @@ class GroupStageTests(TestCase):
         result = self.match.result
         result.score = 2
         result.opponent_score = 1
-        result.score_img = SimpleUploadedFile("score1.jpg", b"file_content")
+        result.score_img = SimpleUploadedFile("score1.jpg", _JPEG_BYTES, content_type="image/jpeg")
         result.save()
         
         # Submit conflicting result from team 2
@@ -138,7 +162,7 @@ class GroupStageTests(TestCase):
                 'match_id': 'GS-A-01',
                 'score': 2,
                 'opponent_score': 0,  # Different score
-                'score_img': SimpleUploadedFile("score2.jpg", b"file_content"),
+                'score_img': SimpleUploadedFile("score2.jpg", _JPEG_BYTES, content_type="image/jpeg"),
             }
         )
         
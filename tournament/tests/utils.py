@@ -1,6 +1,21 @@
+from contextlib import contextmanager
+from django.db.models.signals import post_save
 from django.utils import timezone
 from ..models import Tournament, Team, Match
 
+@contextmanager
+def disconnect_signal(receiver, sender, signal=post_save, dispatch_uid=None):
+    """Temporarily disconnect a signal receiver for bulk test operations.
+
+    Pass the same dispatch_uid the receiver was registered with, if any,
+    or the disconnect will not find it.
+    """
+    signal.disconnect(receiver, sender=sender, dispatch_uid=dispatch_uid)
+    try:
+        yield
+    finally:
+        signal.connect(receiver, sender=sender, dispatch_uid=dispatch_uid)
+
 def create_test_tournament():
     """Create a test tournament with teams"""
     tournament = Tournament.objects.create(
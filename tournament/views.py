@@ -7,7 +7,7 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, IsAdminUser
-from django.db.models import Count, Q
+from django.db.models import Count, Exists, OuterRef, Q
 from .models import Tournament, Team, Match, Result
 from .serializers import (
     TournamentSerializer,
@@ -43,6 +43,17 @@ import itertools
 from django.db import connection
 from django.http import Http404
 
+def _user_team(request):
+    """The requesting user's team, fetched once per request.
+
+    Several views and actions need "the team this user manages" more
+    than once while handling a single request; memoizing on the request
+    keeps that to one query.
+    """
+    if not hasattr(request, '_cached_user_team'):
+        request._cached_user_team = request.user.team_set.first()
+    return request._cached_user_team
+
 class SignUpView(CreateView):
     form_class = UserCreationForm
     success_url = reverse_lazy('login')
@@ -270,7 +281,23 @@ class TournamentAdminView(LoginRequiredMixin, UserPassesTestMixin, TemplateView)
 
 class TournamentViewSet(viewsets.ModelViewSet):
 
-    queryset = Tournament.objects.all()
+    # Annotate the aggregates the serializer exposes so list responses
+    # are a single query instead of extra queries per tournament; the
+    # stage buckets only need booleans, so EXISTS subqueries (which stop
+    # at the first row) beat counting every pending match
+    queryset = Tournament.objects.annotate(
+        registered_team_count=Count(
+            'team', filter=Q(team__registration_complete=True), distinct=True
+        ),
+        semi_pending=Exists(Match.objects.filter(
+            tournament=OuterRef('pk'),
+            status__in=['SCHEDULED', 'PENDING'], stage='SEMI',
+        )),
+        final_pending=Exists(Match.objects.filter(
+            tournament=OuterRef('pk'),
+            status__in=['SCHEDULED', 'PENDING'], stage='FINAL',
+        )),
+    )
     serializer_class = TournamentSerializer
     permission_classes = [IsAuthenticated]
 
@@ -347,7 +374,10 @@ class TeamViewSet(viewsets.ModelViewSet):
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
-        return Team.objects.filter(manager=self.request.user)
+        # Narrowed to the columns TeamSerializer renders
+        return Team.objects.filter(manager=self.request.user).only(
+            'id', 'name', 'player_count', 'registration_complete'
+        )
 
     def perform_create(self, serializer):
         # Check if user already has a team
@@ -371,7 +401,15 @@ class TeamViewSet(viewsets.ModelViewSet):
         return Response({'task_id': task.id})
 
 class MatchViewSet(viewsets.ModelViewSet):
-    queryset = Match.objects.all()
+    # Join the result so the serializer's score fields read the cached
+    # reverse OneToOne instead of querying per match, and fetch only the
+    # columns the serializer renders (the FKs serialize as ids, and
+    # dispute_reason is an unbounded TextField not worth dragging along)
+    queryset = Match.objects.select_related('result').only(
+        'id', 'tournament_id', 'team_home_id', 'team_away_id',
+        'match_date', 'stage', 'status',
+        'result__id', 'result__home_score', 'result__away_score',
+    )
     serializer_class = MatchSerializer
     permission_classes = [IsAuthenticated]
 
@@ -390,7 +428,7 @@ class MatchViewSet(viewsets.ModelViewSet):
             )
 
         # Get the submitting team
-        team = Team.objects.filter(manager=request.user).first()
+        team = _user_team(request)
         if not team or team not in [match.team_home, match.team_away]:
             return Response(
                 {"error": "Not authorized to submit result for this match"},
@@ -423,12 +461,14 @@ class MatchViewSet(viewsets.ModelViewSet):
         return Response({"status": "Result submitted successfully"}, status=status.HTTP_200_OK)
 
 class ResultViewSet(viewsets.ModelViewSet):
-    queryset = Result.objects.all()
+    # The confirm path walks result.match and both of its teams; join them
+    # up front so get_object is one query instead of three
+    queryset = Result.objects.select_related('match__team_home', 'match__team_away')
     serializer_class = ResultSerializer
     permission_classes = [IsAuthenticated]
 
     def perform_create(self, serializer):
-        team = self.request.user.team_set.first()
+        team = _user_team(self.request)
         match = serializer.validated_data.get('match')
         
         if team == match.team_home:
@@ -441,7 +481,7 @@ class ResultViewSet(viewsets.ModelViewSet):
     @action(detail=True, methods=['post'])
     def confirm_result(self, request, pk=None):
         result = self.get_object()
-        team = request.user.team_set.first()
+        team = _user_team(request)
         match = result.match
         
         if team not in [match.team_home, match.team_away]:
@@ -455,14 +495,14 @@ class ResultViewSet(viewsets.ModelViewSet):
             result.home_confirmed = True
         else:
             result.away_confirmed = True
-            
-        result.save()
-        
+
+        result.save(update_fields=['home_confirmed', 'away_confirmed', 'confirmed'])
+
         # Update match status if both teams have confirmed results
         if result.home_confirmed and result.away_confirmed:
             match.status = 'CONFIRMED'
-            match.save()
-        
+            match.save(update_fields=['status'])
+
         return Response({"status": "Result confirmed"})
 
 class AdminDashboardView(LoginRequiredMixin, UserPassesTestMixin, TemplateView):
@@ -593,7 +633,7 @@ class MatchResultConfirmationView(LoginRequiredMixin, DetailView):
 
     def post(self, request, *args, **kwargs):
         match = self.get_object()
-        team = request.user.team_set.first()
+        team = _user_team(request)
 
         if not team or team not in [match.team_home, match.team_away]:
             return HttpResponseForbidden("Not authorized to confirm result for this match")
@@ -620,7 +660,7 @@ class MatchResultConfirmationView(LoginRequiredMixin, DetailView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         match = self.get_object()
-        team = self.request.user.team_set.first()
+        team = _user_team(self.request)
         
         context['result'] = get_object_or_404(
             Result,
@@ -834,7 +874,7 @@ class MatchResultView(LoginRequiredMixin, DetailView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         match = self.get_object()
-        user_team = self.request.user.team_set.first()
+        user_team = _user_team(self.request)
         
         context.update({
             'user_team': user_team,
@@ -847,7 +887,7 @@ class MatchResultView(LoginRequiredMixin, DetailView):
         
     def post(self, request, *args, **kwargs):
         match = self.get_object()
-        user_team = request.user.team_set.first()
+        user_team = _user_team(request)
         
         if match.status != 'SCHEDULED':
             messages.error(request, "Match result cannot be submitted")